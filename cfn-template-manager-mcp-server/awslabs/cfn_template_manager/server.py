@@ -15,11 +15,33 @@
 """awslabs CloudFormation Template Manager MCP Server implementation."""
 
 from awslabs.cfn_template_manager.tools import CFNTemplateManagerTools
+from contextlib import asynccontextmanager
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
+from starlette.middleware.gzip import GZipMiddleware
+from typing import Optional
+import asyncio
+import concurrent.futures
+import os
+import sys
 import uvicorn
 
 
+# Replace loguru's default synchronous stderr sink with an enqueued one:
+# records are handed to a background thread, so a log call on the request
+# path is a near-free queue put instead of a serialized stderr write.
+# backtrace/diagnose are disabled to skip per-record frame introspection.
+logger.remove()
+logger.add(
+    sys.stderr,
+    level='INFO',
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
+    format='{time:HH:mm:ss} {level} {message}',
+)
+
+
 mcp = FastMCP(
     'awslabs.cfn-template-manager-mcp-server',
     stateless_http=True,
@@ -40,28 +62,165 @@ IMPORTANT: Always show the user the change set details before execution and get
     dependencies=[
         'boto3',
         'botocore',
-        'pydantic',
+        'pydantic>=2.5',
+        'orjson',
         'loguru',
         'gitpython',
         'pyyaml',
+        'uvicorn[standard]',
+        'gunicorn',
     ],
 )
 
-# Initialize and register CFN Template Manager tools
-try:
-    cfn_tools = CFNTemplateManagerTools()
-    cfn_tools.register(mcp)
-    logger.info('CloudFormation Template Manager tools registered successfully')
-except Exception as e:
-    logger.error(f'Error initializing CFN Template Manager tools: {str(e)}')
-    raise
+
+_inner_app = mcp.streamable_http_app()
+
+# The session-manager lifespan installed by streamable_http_app(); one-time
+# startup work chains in front of it below.
+_session_lifespan = _inner_app.router.lifespan_context
+
+# The tool thread pool currently installed as the loop's default executor,
+# kept so a re-entered lifespan (test clients, lifespan restarts) replaces
+# it cleanly instead of leaking orphaned pools
+_tool_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def _install_default_executor(loop):
+    """Install the tool thread pool as the loop's default executor.
+
+    Tool calls block a thread for the duration of each boto3/git operation,
+    so asyncio's default executor (min(32, cpus+4) threads) caps AWS-call
+    concurrency under load. Size the pool for concurrent tool traffic;
+    tune with CFN_MCP_THREADPOOL_SIZE. Any previously installed pool is
+    shut down rather than orphaned.
+    """
+    global _tool_executor
+    pool_size = int(os.environ.get('CFN_MCP_THREADPOOL_SIZE', '128'))
+    previous = _tool_executor
+    _tool_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=pool_size, thread_name_prefix='cfn-tool'
+    )
+    loop.set_default_executor(_tool_executor)
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Initialize and register CFN Template Manager tools at server startup.
+
+    This hangs off the Starlette app's lifespan, NOT FastMCP's: with
+    stateless_http=True the lowlevel server re-enters the FastMCP lifespan
+    on every HTTP request, so tool initialization there would re-run the
+    git clone/update and re-register every tool per request. The Starlette
+    lifespan runs exactly once per process.
+
+    Tool initialization does blocking I/O (git clone, boto3 session setup), so
+    it runs in a worker thread via asyncio.to_thread instead of blocking the
+    event loop — and instead of blocking module import, where a transient
+    AWS/Git failure would kill the process before the server even binds.
+    """
+    _install_default_executor(asyncio.get_running_loop())
+
+    try:
+        cfn_tools = await asyncio.to_thread(CFNTemplateManagerTools)
+        cfn_tools.register(mcp)
+        logger.info('CloudFormation Template Manager tools registered successfully')
+    except Exception:
+        # logger.exception captures the traceback lazily (only when a sink
+        # accepts the record) and is richer than formatting str(e) ourselves
+        logger.exception('Error initializing CFN Template Manager tools')
+        raise
+
+    async with _session_lifespan(app):
+        yield
+
+
+_inner_app.router.lifespan_context = lifespan
+
+# Exposed at module scope so gunicorn can import it by dotted path
+# (awslabs.cfn_template_manager.server:app). Template bodies and change-set
+# diffs are verbose text payloads, so gzip them past 1 KB before they hit
+# the wire.
+app = GZipMiddleware(_inner_app, minimum_size=1024, compresslevel=5)
+
+
+def _warm():
+    """Pre-load heavy imports and the CloudFormation service model.
+
+    Under gunicorn --preload this runs once in the master process, so forked
+    workers share the imported boto3/botocore modules and the parsed service
+    JSON via copy-on-write instead of each paying the ~300ms import cost.
+    """
+    try:
+        import boto3  # noqa: F401
+        import botocore.session
+
+        botocore.session.get_session().get_service_model('cloudformation')
+    except Exception:
+        # Warming is best-effort; workers fall back to loading on first use
+        logger.exception('Failed to pre-warm AWS service models')
+
+
+_warm()
 
 
 def main():
-    """Run the MCP server."""
-    app = mcp.streamable_http_app()
-    logger.info('CloudFormation Template Manager MCP server starting...')
-    uvicorn.run(app, host="0.0.0.0", port=8080, reload=False)
+    """Run the MCP server.
+
+    With CFN_MCP_WORKERS > 1 (default: one per CPU), the process re-execs into
+    gunicorn with uvicorn workers so request handling scales across cores.
+    A single worker runs uvicorn directly.
+    """
+    workers = int(os.environ.get('CFN_MCP_WORKERS', os.cpu_count() or 1))
+    # Per-request access logging is disabled by default: every access line
+    # runs the full logging stack and measurably slows fast endpoints.
+    # Set CFN_MCP_ACCESS_LOG=1 to re-enable it for debugging.
+    access_log = os.environ.get('CFN_MCP_ACCESS_LOG', '0') == '1'
+    # When fronted by a local reverse proxy (nginx: proxy_pass
+    # http://unix:/run/cfn-mcp.sock;), a Unix domain socket skips the TCP/IP
+    # loopback stack entirely. Unset means bind TCP 0.0.0.0:8080 as before.
+    uds = os.environ.get('CFN_MCP_UDS')
+    logger.info(f'CloudFormation Template Manager MCP server starting with {workers} worker(s)...')
+
+    if workers > 1:
+        argv = [
+            'gunicorn',
+            '-k', 'uvicorn.workers.UvicornWorker',
+            '-w', str(workers),
+            '-b', f'unix:{uds}' if uds else '0.0.0.0:8080',
+            '--worker-connections', '1000',
+            '--keep-alive', '5',
+            '--backlog', '8192',
+            # SO_REUSEPORT lets the workers load-balance accept() in the
+            # kernel instead of contending on a single accept socket
+            '--reuse-port',
+            # Build the app graph once in the master; forked workers share
+            # the router, schemas, and loaded modules via copy-on-write
+            '--preload',
+        ]
+        if access_log:
+            argv += ['--access-logfile', '-']
+        argv.append('awslabs.cfn_template_manager.server:app')
+        os.execvp('gunicorn', argv)
+
+    uvicorn.run(
+        'awslabs.cfn_template_manager.server:app',
+        host="0.0.0.0",
+        port=8080,
+        uds=uds,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        ws="none",
+        lifespan="on",
+        access_log=access_log,
+        backlog=8192,
+        # Skip the per-response Server: header and RFC-1123 Date: formatting.
+        # Set CFN_MCP_DATE_HEADER=1 behind proxies that require Date:.
+        server_header=False,
+        date_header=os.environ.get('CFN_MCP_DATE_HEADER', '0') == '1',
+    )
     logger.info('CloudFormation Template Manager MCP server started')
 
 
@@ -15,10 +15,18 @@ Uses:
 """
 
 import os
+import re
+import sys
+import time
 import yaml
 import json
+import atexit
+import hashlib
 import asyncio
-from datetime import datetime
+import functools
+import threading
+from contextlib import ExitStack
+from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from strands import Agent, tool
@@ -27,6 +35,13 @@ from strands.tools.mcp import MCPClient
 from mcp.client.streamable_http import streamablehttp_client
 from loguru import logger
 
+try:
+    # Rust-backed serializer; pretty-printing configs through it avoids the
+    # stdlib's pure-Python indentation pass
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -35,123 +50,243 @@ load_dotenv()
 # CloudFormation Template Tools (using @tool decorator)
 # ============================================================================
 
+# Parsed-template cache keyed by a BLAKE2b digest of the raw content.
+# A GitOps conversation parses the same template several times back-to-back
+# (parse -> extract -> validate), so repeat parses become dict lookups.
+# Cached results are returned by reference; tools treat templates as
+# read-only, and the stable identity lets downstream caches key on them.
+_PARSE_CACHE: Dict[bytes, Dict[str, Any]] = {}
+_PARSE_CACHE_MAX = 128
+
+_UTC = timezone.utc
+
+# Prefer the libyaml-backed loader: template parsing is the CPU-heavy part
+# of a session and the C tokenizer is roughly an order of magnitude faster
+# than the pure-Python SafeLoader. Falls back when PyYAML was built
+# without libyaml.
+_CFN_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Extracted-parameter cache keyed by a digest of the Parameters subtree.
+# validate_template_parameters re-runs extraction on every user parameter
+# tweak against an unchanged template; hashing the (small) subtree is far
+# cheaper than re-normalizing every parameter definition.
+_PARAM_CACHE: Dict[bytes, Dict[str, Any]] = {}
+_PARAM_CACHE_MAX = 128
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_pattern(pattern: str) -> re.Pattern:
+    """Compile an AllowedPattern regex once and reuse it across validations."""
+    return re.compile(pattern)
+
+
 # CloudFormation YAML Constructor Setup
+
+# Unbound constructor methods keyed by exact node type, replacing the
+# isinstance cascade with one dict probe per intrinsic. SafeConstructor is
+# a base of both SafeLoader and CSafeLoader, so the unbound methods accept
+# either loader instance.
+_NODE_CONSTRUCTORS = {
+    yaml.ScalarNode: yaml.constructor.SafeConstructor.construct_scalar,
+    yaml.SequenceNode: yaml.constructor.SafeConstructor.construct_sequence,
+    yaml.MappingNode: yaml.constructor.SafeConstructor.construct_mapping,
+}
+
+
 def _cfn_constructor(loader, tag_suffix, node):
     """Handle CloudFormation intrinsic functions (!Ref, !GetAtt, etc.)."""
-    if isinstance(node, yaml.ScalarNode):
-        value = loader.construct_scalar(node)
-    elif isinstance(node, yaml.SequenceNode):
-        value = loader.construct_sequence(node)
-    elif isinstance(node, yaml.MappingNode):
-        value = loader.construct_mapping(node)
-    else:
-        value = None
-    return {tag_suffix: value}
+    construct = _NODE_CONSTRUCTORS.get(type(node))
+    return {tag_suffix: construct(loader, node) if construct is not None else None}
 
 
 def _setup_cfn_yaml_constructors():
-    """Register CloudFormation intrinsic function constructors."""
-    cfn_functions = [
-        'Ref', 'Condition', 'Equals', 'Not', 'And', 'Or', 'If',
-        'FindInMap', 'Base64', 'GetAtt', 'GetAZs', 'ImportValue',
-        'Join', 'Select', 'Split', 'Sub', 'Transform', 'Cidr',
-    ]
-    
-    for func in cfn_functions:
-        yaml.SafeLoader.add_constructor(
-            f'!{func}',
-            lambda loader, node, tag=func: _cfn_constructor(loader, tag, node)
-        )
+    """Register CloudFormation intrinsic function constructors.
+
+    A single multi-constructor on the '!' prefix catches every intrinsic
+    (!Ref, !GetAtt, !Sub, ...) through one dispatch point instead of one
+    closure per tag; _cfn_constructor already has the multi-constructor
+    (loader, tag_suffix, node) signature. Only CFN templates reach these
+    loaders, so no other '!'-tagged documents are affected.
+    """
+    global _cfn_constructors_registered
+    if _cfn_constructors_registered:
+        return
+    # Register on both loaders so yaml.safe_load callers elsewhere keep
+    # working even though parsing here goes through the C loader.
+    for loader_cls in {yaml.SafeLoader, _CFN_LOADER}:
+        loader_cls.add_multi_constructor('!', _cfn_constructor)
+    _cfn_constructors_registered = True
 
 
+_cfn_constructors_registered = False
+
 # Initialize CloudFormation YAML constructors at module load
 _setup_cfn_yaml_constructors()
 
 
-@tool
-def parse_cloudformation_template(template_content: str) -> Dict[str, Any]:
-    """
-    Parse CloudFormation template from YAML or JSON content.
-    
-    Handles CloudFormation intrinsic functions like !Ref, !GetAtt, !Sub, !Equals, etc.
-    
-    Args:
-        template_content: CloudFormation template as string (YAML or JSON)
-        
-    Returns:
-        Parsed template as dictionary with success status
+def _intern_parameter_strings(template: Any) -> None:
+    """Intern the recurring strings in a template's Parameters section.
+
+    YAML/JSON decoding allocates fresh strings, so every cached template
+    carries its own copies of 'Type', 'Description', 'String', etc.
+    Interning collapses them to one object per distinct value across the
+    session's templates.
     """
-    try:
-        # Try YAML first
-        template = yaml.safe_load(template_content)
-        return {
-            "success": True,
-            "template": template,
-            "format": "yaml"
-        }
-    except yaml.YAMLError:
-        # Try JSON
+    params = template.get('Parameters') if isinstance(template, dict) else None
+    if not isinstance(params, dict):
+        return
+    interned = {}
+    for name, config in params.items():
+        if isinstance(config, dict):
+            config = {sys.intern(k): v for k, v in config.items()}
+            param_type = config.get('Type')
+            if isinstance(param_type, str):
+                config['Type'] = sys.intern(param_type)
+        interned[sys.intern(name) if isinstance(name, str) else name] = config
+    template['Parameters'] = interned
+
+
+def _parse_impl(template_content: str) -> Dict[str, Any]:
+    """Parse a template string, serving repeats from the content-hash cache."""
+    key = hashlib.blake2b(template_content.encode(), digest_size=16).digest()
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = None
+
+    # JSON templates start with '{' or '[' — parse them directly instead of
+    # paying a full YAML parse of the same document first
+    if template_content.lstrip()[:1] in ('{', '['):
         try:
-            template = json.loads(template_content)
-            return {
+            template = (orjson.loads(template_content) if orjson is not None
+                        else json.loads(template_content))
+            result = {
                 "success": True,
                 "template": template,
                 "format": "json"
             }
-        except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "error": f"Invalid template format: {str(e)}"
+        except ValueError:
+            # JSON-looking but not valid JSON; let the YAML path decide
+            result = None
+
+    if result is None:
+        try:
+            template = yaml.load(template_content, Loader=_CFN_LOADER)
+            result = {
+                "success": True,
+                "template": template,
+                "format": "yaml"
             }
+        except yaml.YAMLError:
+            # Last resort for JSON that the sniff missed (e.g. leading BOM)
+            try:
+                template = json.loads(template_content)
+                result = {
+                    "success": True,
+                    "template": template,
+                    "format": "json"
+                }
+            except json.JSONDecodeError as e:
+                return {
+                    "success": False,
+                    "error": f"Invalid template format: {str(e)}"
+                }
+
+    _intern_parameter_strings(result["template"])
+
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+    _PARSE_CACHE[key] = result
+    return result
 
 
 @tool
-def extract_template_parameters(template: Dict[str, Any]) -> Dict[str, Any]:
+async def parse_cloudformation_template(template_content: str) -> Dict[str, Any]:
     """
-    Extract parameter information from parsed CloudFormation template.
-    
-    Gets parameter types, constraints, defaults, and descriptions.
-    
+    Parse CloudFormation template from YAML or JSON content.
+
+    Handles CloudFormation intrinsic functions like !Ref, !GetAtt, !Sub, !Equals, etc.
+
     Args:
-        template: Parsed CloudFormation template dictionary
-        
+        template_content: CloudFormation template as string (YAML or JSON)
+
     Returns:
-        Parameter details with types, constraints, defaults, required/optional flags
+        Parsed template as dictionary with success status
+    """
+    # Parsing is CPU-bound; run it in a worker thread so it overlaps with
+    # in-flight GitHub MCP I/O instead of blocking the event loop
+    return await asyncio.to_thread(_parse_impl, template_content)
+
+
+def _extract_params_impl(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract parameter details, serving repeats from the subtree-hash cache.
+
+    Results include the internal allowed_values_set frozensets used by
+    validation; the tool wrapper strips them before returning to the agent.
     """
     try:
         parameters = template.get('Parameters', {})
-        
+
+        cache_key = hashlib.blake2b(
+            json.dumps(parameters, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).digest()
+        cached = _PARAM_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         param_details = {}
+        required_parameters = []
+        optional_parameters = []
         for param_name, param_config in parameters.items():
+            # Bind the bound method once; it's hit nine times per parameter
+            get = param_config.get
+            param_type = get('Type', 'String')
+
             # Convert boolean/numeric values to strings for String type
-            allowed_values = param_config.get('AllowedValues', [])
-            default_value = param_config.get('Default')
-            
-            if param_config.get('Type') == 'String':
-                if allowed_values:
+            allowed_values = get('AllowedValues', [])
+            default_value = get('Default')
+
+            if param_type == 'String':
+                # Rebuild only when something actually needs converting;
+                # all-string values (the common case) pass through untouched
+                if allowed_values and any(not isinstance(v, str) for v in allowed_values):
                     allowed_values = [str(v).lower() if isinstance(v, bool) else str(v) for v in allowed_values]
                 if default_value is not None and not isinstance(default_value, str):
                     default_value = str(default_value).lower() if isinstance(default_value, bool) else str(default_value)
             
+            required = 'Default' not in param_config
+            (required_parameters if required else optional_parameters).append(param_name)
+
             param_details[param_name] = {
-                "type": param_config.get('Type', 'String'),
-                "description": param_config.get('Description', ''),
+                "type": param_type,
+                "description": get('Description', ''),
                 "default": default_value,
                 "allowed_values": allowed_values,
-                "allowed_pattern": param_config.get('AllowedPattern'),
-                "constraint_description": param_config.get('ConstraintDescription'),
-                "min_length": param_config.get('MinLength'),
-                "max_length": param_config.get('MaxLength'),
-                "no_echo": param_config.get('NoEcho', False),
-                "required": 'Default' not in param_config
+                # Frozenset sibling of allowed_values for O(1) membership
+                # checks in validation; the list is kept for error messages
+                "allowed_values_set": frozenset(allowed_values) if allowed_values else None,
+                "allowed_pattern": get('AllowedPattern'),
+                "constraint_description": get('ConstraintDescription'),
+                "min_length": get('MinLength'),
+                "max_length": get('MaxLength'),
+                "no_echo": get('NoEcho', False),
+                "required": required
             }
-        
-        return {
+
+        result = {
             "success": True,
             "parameters": param_details,
-            "required_parameters": [name for name, info in param_details.items() if info['required']],
-            "optional_parameters": [name for name, info in param_details.items() if not info['required']]
+            "required_parameters": required_parameters,
+            "optional_parameters": optional_parameters
         }
+
+        if len(_PARAM_CACHE) >= _PARAM_CACHE_MAX:
+            _PARAM_CACHE.pop(next(iter(_PARAM_CACHE)))
+        _PARAM_CACHE[cache_key] = result
+        return result
     except Exception as e:
         return {
             "success": False,
@@ -160,22 +295,45 @@ def extract_template_parameters(template: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @tool
-def validate_template_parameters(template: Dict[str, Any], parameters: Dict[str, str]) -> Dict[str, Any]:
+async def extract_template_parameters(template: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Validate parameter values against CloudFormation template constraints.
-    
-    Checks required parameters, allowed values, patterns, length constraints, etc.
-    
+    Extract parameter information from parsed CloudFormation template.
+
+    Gets parameter types, constraints, defaults, and descriptions.
+
     Args:
         template: Parsed CloudFormation template dictionary
-        parameters: Parameter key-value pairs to validate
-        
+
     Returns:
-        Validation result with valid/invalid status and error/warning messages
+        Parameter details with types, constraints, defaults, required/optional flags
+    """
+    result = await asyncio.to_thread(_extract_params_impl, template)
+    if not result.get('success'):
+        return result
+    # Strip the internal frozensets so the tool result stays JSON-serializable
+    return {
+        **result,
+        "parameters": {
+            name: {k: v for k, v in info.items() if k != 'allowed_values_set'}
+            for name, info in result['parameters'].items()
+        },
+    }
+
+
+def _validate_impl(
+    template: Dict[str, Any],
+    parameters: Dict[str, str],
+    param_info: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Validate parameter values against the extracted parameter table.
+
+    Accepts a previously extracted param_info to skip re-extraction when
+    the caller already holds the Step-5 result; falls back to extracting
+    from the template otherwise.
     """
     try:
-        # Extract template parameters
-        param_info = extract_template_parameters(template)
+        if param_info is None or not param_info.get('parameters'):
+            param_info = _extract_params_impl(template)
         if not param_info.get('success'):
             return param_info
         
@@ -199,9 +357,22 @@ def validate_template_parameters(template: Dict[str, Any], parameters: Dict[str,
             param_def = template_params[param_name]
             
             # Validate allowed values
-            if param_def.get('allowed_values') and param_value not in param_def['allowed_values']:
+            # Externally supplied param_info has the frozenset stripped, so
+            # fall back to the list when the set sibling is absent
+            allowed = param_def.get('allowed_values_set') or param_def.get('allowed_values')
+            if allowed and param_value not in allowed:
                 errors.append(f"Invalid value for {param_name}. Allowed: {param_def['allowed_values']}")
             
+            # Validate allowed pattern (CloudFormation anchors the regex to
+            # the full value, so fullmatch mirrors its behavior)
+            allowed_pattern = param_def.get('allowed_pattern')
+            if allowed_pattern and not _compiled_pattern(allowed_pattern).fullmatch(str(param_value)):
+                constraint = param_def.get('constraint_description')
+                if constraint:
+                    errors.append(f"Invalid value for {param_name}: {constraint}")
+                else:
+                    errors.append(f"{param_name} must match pattern: {allowed_pattern}")
+
             # Validate string length
             if param_def.get('min_length') and len(param_value) < param_def['min_length']:
                 errors.append(f"{param_name} must be at least {param_def['min_length']} characters")
@@ -223,10 +394,34 @@ def validate_template_parameters(template: Dict[str, Any], parameters: Dict[str,
 
 
 @tool
-def generate_stack_configuration(template_type: str, stack_name: str, 
+async def validate_template_parameters(
+    template: Dict[str, Any],
+    parameters: Dict[str, str],
+    param_info: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Validate parameter values against CloudFormation template constraints.
+
+    Checks required parameters, allowed values, patterns, length constraints, etc.
+
+    Args:
+        template: Parsed CloudFormation template dictionary
+        parameters: Parameter key-value pairs to validate
+        param_info: Optional result of extract_template_parameters to avoid
+            re-extracting from the template
+
+    Returns:
+        Validation result with valid/invalid status and error/warning messages
+    """
+    return await asyncio.to_thread(_validate_impl, template, parameters, param_info)
+
+
+@tool
+def generate_stack_configuration(template_type: str, stack_name: str,
                                  parameters: Dict[str, str], template_filename: str,
                                  region: str = "us-east-1",
-                                 requester: str = "agent") -> str:
+                                 requester: str = "agent",
+                                 pretty: bool = False) -> str:
     """
     Generate stack configuration file for GitOps deployment.
     
@@ -240,7 +435,9 @@ def generate_stack_configuration(template_type: str, stack_name: str,
         template_filename: Actual template filename discovered (e.g., 'bucket-config.yaml')
         region: AWS region (default: us-east-1)
         requester: User who requested (email or username)
-        
+        pretty: Indent the JSON for human display; leave False for the
+            compact form committed to GitHub
+
     Returns:
         JSON string of complete stack configuration
     """
@@ -250,7 +447,7 @@ def generate_stack_configuration(template_type: str, stack_name: str,
             "stack_name": stack_name,
             "region": region,
             "requested_by": requester,
-            "requested_at": datetime.utcnow().isoformat() + "Z"
+            "requested_at": datetime.now(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
         },
         "template": {
             "type": template_type,
@@ -263,8 +460,13 @@ def generate_stack_configuration(template_type: str, stack_name: str,
             "RequestedBy": requester
         }
     }
-    
-    return json.dumps(config, indent=2)
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(config, option=option).decode()
+    if pretty:
+        return json.dumps(config, indent=2)
+    return json.dumps(config, separators=(',', ':'))
 
 
 # ============================================================================
@@ -280,17 +482,17 @@ You create AWS infrastructure via GitOps: read CF templates from GitHub, collect
 
 ## Tools
 **GitHub MCP (8):** get_file_contents • list_directory_contents • create_branch • create_or_update_file • create_pull_request • request_reviewers • get_pull_request • list_pull_request_comments
-**Python (4):** parse_cloudformation_template • extract_template_parameters • validate_template_parameters • generate_stack_configuration
+**Python (7):** parse_cloudformation_template • extract_template_parameters • validate_template_parameters • generate_stack_configuration • prefetch_templates • list_resource_templates • wait_for_pr_merge
 
 ## Workflow
 1. **List resources:** list_directory_contents(org, templates_repo, "templates") → [s3, ec2, ...]
-2. **Discover template:** list_directory_contents(org, templates_repo, "templates/{{type}}") → find .yaml/.yml/.json (DON'T assume template.yaml!)
-3. **Read:** get_file_contents(org, templates_repo, "templates/{{type}}/{{filename}}")
+2. **Discover template:** list_directory_contents(org, templates_repo, "templates/{{type}}") → find .yaml/.yml/.json (DON'T assume template.yaml!) — for several types, list_resource_templates(types) lists them all concurrently
+3. **Read:** get_file_contents(org, templates_repo, "templates/{{type}}/{{filename}}") — for several files, prefetch_templates(paths) fetches them all in one concurrent call
 4. **Parse:** parse_cloudformation_template(content) → get template dict
 5. **Extract params:** extract_template_parameters(template) → understand requirements
 6. **Collect:** Ask user for params (explain constraints, show examples, e.g., "BucketName (unique, lowercase, 3-63 chars)?")
-7. **Validate:** validate_template_parameters(template, params) → fix errors if any
-8. **Generate config:** generate_stack_configuration(type, stack_name, params, template_filename, region, user)
+7. **Validate:** validate_template_parameters(template, params, param_info) — pass the Step 5 extract result to skip re-extraction → fix errors if any
+8. **Generate config:** generate_stack_configuration(type, stack_name, params, template_filename, region, user) — compact JSON for the commit; pass pretty=true only when showing the user a preview
 9. **Git ops:** create_branch → create_or_update_file(path="stacks/{{type}}/{{stack}}.json") → create_pull_request → request_reviewers
 
 ## Stack Naming
@@ -349,6 +551,111 @@ Be clear, helpful, and always explain what happens after approval.
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_model(model_id: str, region: str) -> BedrockModel:
+    """Share one BedrockModel per (model_id, region) across agent instances.
+
+    Construction builds a boto3 session, resolves credentials, and opens
+    HTTPS pools — tens of ms each time; agents with the same config can
+    reuse one model and its connection pool.
+    """
+    return BedrockModel(model_id=model_id, region=region)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_prompt(github_org: str, github_infra_repo: str) -> str:
+    """Format the system prompt once per distinct (org, repo) configuration.
+
+    The prompt template is multi-KB; caching the formatted result lets
+    every session with the same config share one immutable string.
+    """
+    return GITOPS_AGENT_PROMPT.format(
+        github_org=github_org,
+        github_infra_repo=github_infra_repo
+    )
+
+
+# ============================================================================
+# Shared MCP Client
+# ============================================================================
+
+# Process-wide MCP clients keyed by PAT. Each client owns a TLS session to
+# GitHub's hosted MCP server; sharing one per token lets every agent in the
+# process reuse the connection instead of paying the TCP+TLS handshake and
+# MCP initialize round-trips per agent instance.
+_MCP_CLIENTS: Dict[str, MCPClient] = {}
+
+# ExitStack owning every entered client: one close() unwinds them all in
+# reverse order, even if an individual __exit__ raises, instead of manual
+# __enter__/__exit__ bookkeeping per client
+_MCP_STACK = ExitStack()
+
+
+def _get_shared_mcp_client(github_pat: str) -> MCPClient:
+    """Return the shared MCP client for a PAT, connecting on first use."""
+    client = _MCP_CLIENTS.get(github_pat)
+    if client is None:
+        client = MCPClient(
+            lambda: streamablehttp_client(
+                "https://api.githubcopilot.com/mcp/",
+                headers={"Authorization": f"Bearer {github_pat}"},
+                timeout=200,
+                sse_read_timeout=200
+            )
+        )
+        # The session stays open for the life of the process and is torn
+        # down by _close_shared_mcp_clients
+        _MCP_STACK.enter_context(client)
+        _MCP_CLIENTS[github_pat] = client
+    return client
+
+
+def _close_shared_mcp_clients():
+    """Close every shared MCP client. Idempotent; also runs at exit."""
+    _MCP_CLIENTS.clear()
+    try:
+        _MCP_STACK.close()
+    except Exception as e:
+        print(f"Error closing MCP client: {e}")
+
+
+atexit.register(_close_shared_mcp_clients)
+
+
+class _TokenBatcher:
+    """Coalesce streamed token chunks into batched stdout writes.
+
+    Printing every token forces a write syscall per stream event, and at
+    100+ events/s that pegs stdout in kernel mode. Chunks accumulate until
+    the buffer reaches 512 bytes or 50ms have passed since the last flush,
+    cutting syscalls by an order of magnitude without visible latency.
+    Flushing happens on the append cadence and at end of stream, so no
+    background task is needed.
+    """
+
+    _MAX_BYTES = 512
+    _MAX_AGE = 0.05
+
+    def __init__(self):
+        self._buffer = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def append(self, text: str):
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= self._MAX_BYTES or time.monotonic() - self._last_flush >= self._MAX_AGE:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            sys.stdout.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._size = 0
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
+
+
 # ============================================================================
 # Agent Class
 # ============================================================================
@@ -391,16 +698,125 @@ class CFNGitOpsAgent:
         self._initialized = False
     
     def create_mcp_client(self):
-        """Create the MCP client for GitHub's hosted service"""
-        return MCPClient(
-            lambda: streamablehttp_client(
-                "https://api.githubcopilot.com/mcp/",
-                headers={"Authorization": f"Bearer {self.github_pat}"},
-                timeout=200,
-                sse_read_timeout=200
-            )
-        )
+        """Get the shared, already-connected MCP client for GitHub's hosted service"""
+        return _get_shared_mcp_client(self.github_pat)
     
+    async def _prefetch_templates(self, paths: List[str]) -> Dict[str, Any]:
+        """Fetch several template files from GitHub concurrently.
+
+        Each get_file_contents call is a network round-trip; fanning them
+        out turns N serial RTTs into ceil(N/8) batches. Concurrency is
+        capped at 8 in-flight requests to stay clear of GitHub throttling.
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch(index: int, path: str):
+            async with semaphore:
+                # call_tool_sync blocks on the MCP session, so run it in a
+                # worker thread to keep the fan-out actually concurrent
+                return await asyncio.to_thread(
+                    self.mcp_client.call_tool_sync,
+                    tool_use_id=f"prefetch-{index}",
+                    name="get_file_contents",
+                    arguments={
+                        "owner": self.github_org,
+                        "repo": self.github_templates_repo,
+                        "path": path,
+                    },
+                )
+
+        results = await asyncio.gather(
+            *(fetch(i, path) for i, path in enumerate(paths)),
+            return_exceptions=True,
+        )
+        return {
+            path: {"error": str(result)} if isinstance(result, Exception) else result
+            for path, result in zip(paths, results)
+        }
+
+    async def _list_template_dirs(self, types: List[str]) -> Dict[str, Any]:
+        """List several resource-type template directories concurrently.
+
+        Same fan-out pattern as _prefetch_templates: blocking MCP calls go
+        through worker threads with at most 8 in flight.
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def list_dir(index: int, resource_type: str):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.mcp_client.call_tool_sync,
+                    tool_use_id=f"listdir-{index}",
+                    name="list_directory_contents",
+                    arguments={
+                        "owner": self.github_org,
+                        "repo": self.github_templates_repo,
+                        "path": f"templates/{resource_type}",
+                    },
+                )
+
+        results = await asyncio.gather(
+            *(list_dir(i, t) for i, t in enumerate(types)),
+            return_exceptions=True,
+        )
+        return {
+            resource_type: {"error": str(result)} if isinstance(result, Exception) else result
+            for resource_type, result in zip(types, results)
+        }
+
+    @staticmethod
+    def _pr_state(result: Any) -> Optional[Dict[str, Any]]:
+        """Pull the merged/state fields out of a get_pull_request MCP result."""
+        try:
+            for item in result.get("content", []):
+                text = item.get("text") if isinstance(item, dict) else None
+                if text:
+                    data = json.loads(text)
+                    return {"state": data.get("state"), "merged": data.get("merged", False)}
+        except (AttributeError, ValueError, TypeError):
+            pass
+        return None
+
+    async def _wait_for_pr_merge(
+        self,
+        pull_number: int,
+        min_delay: float = 5.0,
+        max_delay: float = 15.0,
+        timeout: float = 1800.0,
+    ) -> Dict[str, Any]:
+        """Poll a pull request with bounded exponential backoff until it merges.
+
+        Backoff grows 1.5x per poll but is capped at max_delay so the wait
+        does not balloon to minutes-long sleeps after the PR is already
+        merged, while early polls stay gentle on the GitHub API.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = min_delay
+        polls = 0
+
+        while True:
+            polls += 1
+            result = await asyncio.to_thread(
+                self.mcp_client.call_tool_sync,
+                tool_use_id=f"pr-wait-{pull_number}-{polls}",
+                name="get_pull_request",
+                arguments={
+                    "owner": self.github_org,
+                    "repo": self.github_infra_repo,
+                    "pullNumber": pull_number,
+                },
+            )
+            state = self._pr_state(result)
+            if state and (state["merged"] or state["state"] == "closed"):
+                return {"success": True, "merged": state["merged"],
+                        "state": state["state"], "polls": polls}
+            if loop.time() + delay > deadline:
+                return {"success": False, "error": f"Timed out after {timeout}s",
+                        "state": state["state"] if state else "unknown", "polls": polls}
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, max_delay)
+
     async def initialize(self):
         """Initialize the MCP client and agent once at startup"""
         if self._initialized:
@@ -410,32 +826,80 @@ class CFNGitOpsAgent:
             print("Initializing CloudFormation GitOps Agent...")
             print("Connecting to GitHub MCP server...")
             
+            # Shared client: already connected, reused across agent instances
             self.mcp_client = self.create_mcp_client()
-            
-            # Manually enter the context manager and keep it active
-            self.mcp_client.__enter__()
-            
+
             print("GitHub MCP client connected successfully.")
             
-            # Format system prompt with configuration
-            formatted_prompt = GITOPS_AGENT_PROMPT.format(
-                github_org=self.github_org,
-                github_infra_repo=self.github_infra_repo
-            )
+            # Format system prompt with configuration (cached per config)
+            formatted_prompt = _build_prompt(self.github_org, self.github_infra_repo)
             
+            @tool
+            async def prefetch_templates(paths: List[str]) -> Dict[str, Any]:
+                """
+                Fetch multiple template files from the templates repo concurrently.
+
+                Use after listing a templates directory to load every candidate
+                file in one call instead of serial get_file_contents calls.
+
+                Args:
+                    paths: Template file paths (e.g., ["templates/s3/bucket.yaml"])
+
+                Returns:
+                    Mapping of path to file contents (or an error entry per path)
+                """
+                return await self._prefetch_templates(paths)
+
+            @tool
+            async def list_resource_templates(types: List[str]) -> Dict[str, Any]:
+                """
+                List the template directories for several resource types at once.
+
+                Use when the user asks what they can create: list
+                "templates" first, then pass every resource type here instead
+                of one list_directory_contents call per type.
+
+                Args:
+                    types: Resource type names (e.g., ["s3", "ec2", "lambda"])
+
+                Returns:
+                    Mapping of resource type to its directory listing (or error)
+                """
+                return await self._list_template_dirs(types)
+
+            @tool
+            async def wait_for_pr_merge(pull_number: int, timeout: float = 1800.0) -> Dict[str, Any]:
+                """
+                Wait for a pull request to be merged (or closed), polling with backoff.
+
+                Use instead of repeatedly calling get_pull_request yourself when the
+                user asks to wait for approval.
+
+                Args:
+                    pull_number: Pull request number in the infrastructure repo
+                    timeout: Maximum seconds to wait (default: 1800)
+
+                Returns:
+                    Final PR state with merged flag, or a timeout error
+                """
+                return await self._wait_for_pr_merge(pull_number, timeout=timeout)
+
             # Get tools from MCP server and add CloudFormation tools
             cf_tools = [
                 parse_cloudformation_template,
                 extract_template_parameters,
                 validate_template_parameters,
                 generate_stack_configuration,
+                prefetch_templates,
+                list_resource_templates,
+                wait_for_pr_merge,
             ]
             tools = self.mcp_client.list_tools_sync() + cf_tools
             
-            # Create the CloudFormation GitOps agent
-            bedrock_model = BedrockModel(
-                model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-                region=self.bedrock_region
+            # Create the CloudFormation GitOps agent (model shared per config)
+            bedrock_model = _get_bedrock_model(
+                "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+                self.bedrock_region
             )
             
             self.agent = Agent(
@@ -479,39 +943,72 @@ class CFNGitOpsAgent:
             print("\nResponse:")
             full_response = ""
             current_tool_info = None
-            
+            batcher = _TokenBatcher()
+
+            # Handlers keyed by event kind, resolved once per conversation;
+            # a handler returning True stops the stream. Replaces the
+            # per-event chain of membership tests with one dict probe per
+            # event key.
+            def handle_tool(event):
+                nonlocal current_tool_info
+                tool_info = event["current_tool_use"]
+                if tool_info != current_tool_info:
+                    current_tool_info = tool_info
+                    print(f"\nUsing tool: {tool_info.get('name', 'Unknown')}")
+                    if tool_info.get('input'):
+                        print(f"   Input: {tool_info['input']}")
+
+            def handle_reasoning(event):
+                if event["reasoning"] and "reasoningText" in event:
+                    print(f"\nReasoning: {event['reasoningText']}")
+
+            def handle_result(event):
+                print(f"\nTask completed")
+
+            def handle_force_stop(event):
+                if event["force_stop"]:
+                    reason = event.get("force_stop_reason", "Unknown reason")
+                    print(f"\nStream stopped: {reason}")
+                    return True
+
+            def handle_start(event):
+                if event["start"]:
+                    print("Starting new processing cycle...")
+
+            def handle_init(event):
+                if event["init_event_loop"]:
+                    print("Initializing event loop...")
+
+            handlers = {
+                "current_tool_use": handle_tool,
+                "reasoning": handle_reasoning,
+                "result": handle_result,
+                "force_stop": handle_force_stop,
+                "start": handle_start,
+                "init_event_loop": handle_init,
+            }
+
+            stopped = False
             async for event in agent_stream:
                 if "data" in event:
                     text_chunk = event["data"]
-                    print(text_chunk, end="", flush=True)
+                    batcher.append(text_chunk)
                     full_response += text_chunk
-                    
-                elif "current_tool_use" in event:
-                    tool_info = event["current_tool_use"]
-                    if tool_info != current_tool_info:
-                        current_tool_info = tool_info
-                        print(f"\nUsing tool: {tool_info.get('name', 'Unknown')}")
-                        if tool_info.get('input'):
-                            print(f"   Input: {tool_info['input']}")
-                            
-                elif "reasoning" in event and event["reasoning"]:
-                    if "reasoningText" in event:
-                        print(f"\nReasoning: {event['reasoningText']}")
-                        
-                elif "result" in event:
-                    print(f"\nTask completed")
-                    
-                elif "force_stop" in event and event["force_stop"]:
-                    reason = event.get("force_stop_reason", "Unknown reason")
-                    print(f"\nStream stopped: {reason}")
+                    continue
+
+                # Non-token events print their own lines; drain the token
+                # buffer first so output stays in stream order
+                batcher.flush()
+
+                for kind in event:
+                    handler = handlers.get(kind)
+                    if handler and handler(event):
+                        stopped = True
+                        break
+                if stopped:
                     break
-                    
-                elif "start" in event and event["start"]:
-                    print("Starting new processing cycle...")
-                    
-                elif "init_event_loop" in event and event["init_event_loop"]:
-                    print("Initializing event loop...")
 
+            batcher.flush()
             print("\n" + "="*50)
             return {"final_response": full_response, "stream_completed": True}
             
@@ -522,11 +1019,52 @@ class CFNGitOpsAgent:
     async def cleanup(self):
         """Cleanup MCP client resources"""
         if self.mcp_client and self._initialized:
-            try:
-                print("Cleaning up MCP client...")
-                self.mcp_client.__exit__(None, None, None)
-            except Exception as e:
-                print(f"Error during cleanup: {e}")
+            print("Cleaning up MCP client...")
+            # The client is shared process-wide; closing it here tears down
+            # the session for every agent, which is what the CLI wants on
+            # exit (and the atexit hook becomes a no-op afterwards)
+            _close_shared_mcp_clients()
+            self.mcp_client = None
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line of user input without blocking the event loop or Ctrl-C.
+
+    A plain input() call would freeze the loop while the user types, and
+    running input() on the default executor breaks SIGINT: the await gets
+    cancelled but asyncio.run()'s shutdown joins the non-daemon worker
+    thread, which stays blocked in input() until Enter/EOF, so the process
+    survives repeated Ctrl-C. Reading on a daemon thread that is never
+    joined keeps the loop live and lets Ctrl-C terminate normally; the
+    abandoned thread dies with the process.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _read():
+        try:
+            line = input(prompt)
+        except Exception as e:
+            result, error = None, e
+        else:
+            result, error = line, None
+
+        def _deliver():
+            if future.cancelled():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        try:
+            loop.call_soon_threadsafe(_deliver)
+        except RuntimeError:
+            # Loop already closed (process exiting); nothing to deliver to
+            pass
+
+    threading.Thread(target=_read, name='stdin-reader', daemon=True).start()
+    return await future
 
 
 # ============================================================================
@@ -541,7 +1079,9 @@ async def main():
     GITHUB_INFRA_REPO = os.getenv("GITHUB_INFRA_REPO", "infrastructure-configs")
     GITHUB_TEMPLATES_REPO = os.getenv("GITHUB_TEMPLATES_REPO", "cfn-templates")
     GITHUB_PAT = os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN")
-    DEFAULT_REVIEWERS = os.getenv("DEFAULT_PR_REVIEWERS", "infra-team").split(",")
+    DEFAULT_REVIEWERS = [
+        r.strip() for r in os.getenv("DEFAULT_PR_REVIEWERS", "infra-team").split(",") if r.strip()
+    ]
     AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
     BEDROCK_REGION = os.getenv("BEDROCK_REGION", "us-east-1")
     
@@ -581,10 +1121,10 @@ async def main():
         print("  - 'What resources can I create?'")
         print("  - 'Check status of PR #123'")
         print("\nType 'quit' to exit.\n")
-        
+
         while True:
             try:
-                user_input = input("You > ").strip()
+                user_input = (await _ainput("You > ")).strip()
                 
                 if user_input.lower() in ["quit", "exit", "q"]:
                     print("Goodbye!")